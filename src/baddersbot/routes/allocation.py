@@ -1,24 +1,27 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
-from pathlib import Path
+from functools import lru_cache
 from typing import Iterable
 
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 
-from ..services.data_store import iter_collection
+from ..services.data_store import get_data_version, iter_collection
+from ..templating import render_cached
 from .navigation import build_nav_context
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
-_templates_dir = Path(__file__).resolve().parent.parent / "templates"
-templates = Jinja2Templates(directory=str(_templates_dir))
+_MESSAGE_FOOTER: tuple[str, ...] = (
+    "",
+    "Any cancellations, let me know ASAP! 🏸😊",
+    "The key will need collecting and returning – volunteer sooner rather than later!",
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerAllocation:
     name: str
     grade: str
@@ -27,7 +30,7 @@ class PlayerAllocation:
     notes: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionAllocation:
     id: str
     date: date
@@ -38,23 +41,20 @@ class SessionAllocation:
     waitlist: list[PlayerAllocation]
     confidence: str
     notes: str = ""
+    allocated: int = field(init=False)
+    remaining: int = field(init=False)
+    fill_percentage: int = field(init=False)
+    weekday_label: str = field(init=False)
+    date_label: str = field(init=False)
 
-    @property
-    def allocated(self) -> int:
-        return len(self.assigned)
-
-    @property
-    def remaining(self) -> int:
-        return max(self.capacity - self.allocated, 0)
+    def __post_init__(self) -> None:
+        self.weekday_label, _, self.date_label = self.date.strftime("%A, %d %b").partition(", ")
+        self.allocated = len(self.assigned)
+        self.remaining = max(self.capacity - self.allocated, 0)
+        self.fill_percentage = int((self.allocated / self.capacity) * 100) if self.capacity else 0
 
-    @property
-    def fill_percentage(self) -> int:
-        if not self.capacity:
-            return 0
-        return int((self.allocated / self.capacity) * 100)
 
-
-@dataclass
+@dataclass(slots=True)
 class SessionGroupMessage:
     id: str
     label: str
@@ -71,47 +71,61 @@ class SessionGroupMessage:
 
 
 @router.get("/allocation", response_class=HTMLResponse)
-async def allocation_management(request: Request) -> HTMLResponse:
+def allocation_management(request: Request) -> HTMLResponse:
     """Render the allocation management workspace."""
-    sessions = _load_session_allocations()
+    version = get_data_version()
 
-    context = {
-        "request": request,
-        "sessions": sessions,
-        "summary": _build_summary(sessions),
-    }
-    context.update(build_nav_context("allocation"))
-    return templates.TemplateResponse("allocation_management.html", context)
+    def build_context() -> dict[str, object]:
+        sessions = _load_session_allocations_cached(version)
+        context: dict[str, object] = {
+            "request": request,
+            "sessions": sessions,
+            "summary": _build_summary(sessions),
+        }
+        context.update(build_nav_context("allocation"))
+        return context
+
+    return render_cached("allocation_management.html", version, build_context)
 
 
 @router.get("/allocation/messages", response_class=HTMLResponse)
-async def allocation_messages(request: Request) -> HTMLResponse:
+def allocation_messages(request: Request) -> HTMLResponse:
     """Render WhatsApp-ready messages for each session."""
-    sessions = _load_session_allocations()
-    messages = _build_session_messages(sessions)
+    version = get_data_version()
 
-    context = {
-        "request": request,
-        "messages": messages,
-        "session_count": len(messages),
-    }
-    context.update(build_nav_context("messages"))
-    return templates.TemplateResponse("allocation_messages.html", context)
+    def build_context() -> dict[str, object]:
+        messages = _build_session_messages(_load_session_allocations_cached(version))
+        context: dict[str, object] = {
+            "request": request,
+            "messages": messages,
+            "session_count": len(messages),
+        }
+        context.update(build_nav_context("messages"))
+        return context
+
+    return render_cached("allocation_messages.html", version, build_context)
 
 
 def _build_summary(sessions: Iterable[SessionAllocation]) -> dict[str, int]:
-    sessions = list(sessions)
+    total_sessions = fully_booked = open_slots = waitlisted_players = 0
+    for session in sessions:
+        remaining = session.remaining
+        total_sessions += 1
+        if remaining == 0:
+            fully_booked += 1
+        open_slots += remaining
+        waitlisted_players += len(session.waitlist)
     return {
-        "total_sessions": len(sessions),
-        "fully_booked": sum(1 for session in sessions if session.remaining == 0),
-        "open_slots": sum(session.remaining for session in sessions),
-        "waitlisted_players": sum(len(session.waitlist) for session in sessions),
+        "total_sessions": total_sessions,
+        "fully_booked": fully_booked,
+        "open_slots": open_slots,
+        "waitlisted_players": waitlisted_players,
     }
 
 
 def _build_session_messages(sessions: Iterable[SessionAllocation]) -> list[SessionGroupMessage]:
     messages: list[SessionGroupMessage] = []
-    for session in sessions:
+    for session in sorted(sessions, key=lambda session: session.date):
         confirmed_names = [player.name for player in session.assigned]
         waitlist_names = [player.name for player in session.waitlist]
         composed = _compose_session_message(session, confirmed_names, waitlist_names)
@@ -127,7 +141,6 @@ def _build_session_messages(sessions: Iterable[SessionAllocation]) -> list[Sessi
                 message=composed,
             )
         )
-    messages.sort(key=lambda message: message.date)
     return messages
 
 
@@ -139,13 +152,11 @@ def _compose_session_message(
     confirmed = list(confirmed)
     waitlist = list(waitlist)
 
-    weekday = session.date.strftime("%A")
-    date_label = session.date.strftime("%d %b")
     time_part, location = _split_label(session.label)
 
     lines: list[str] = []
     location_fragment = f" at {location}" if location else ""
-    lines.append(f"{weekday}'s players{location_fragment} ({date_label})")
+    lines.append(f"{session.weekday_label}'s players{location_fragment} ({session.date_label})")
     if time_part:
         lines.append("")
         lines.append(f"{time_part}:")
@@ -163,17 +174,15 @@ def _compose_session_message(
         lines.append("")
         lines.append(f"Notes: {session.notes}")
 
-    lines.append("")
-    lines.append("Any cancellations, let me know ASAP! 🏸😊")
-    lines.append("The key will need collecting and returning – volunteer sooner rather than later!")
+    lines.extend(_MESSAGE_FOOTER)
 
     return "\n".join(lines)
 
 
 def _split_label(label: str) -> tuple[str, str | None]:
-    parts = [part.strip() for part in label.split("-", maxsplit=1)]
-    if len(parts) == 2:
-        return parts[0], parts[1]
+    left, separator, right = label.partition("-")
+    if separator:
+        return left.strip(), right.strip()
     return label, None
 
 
@@ -182,12 +191,12 @@ def _join_names_line(names: Iterable[str]) -> str:
 
 
 def _join_names(names: Iterable[str]) -> str:
-    names = [name.strip() for name in names if name.strip()]
+    names = [stripped for name in names if (stripped := name.strip())]
     if not names:
         return ""
-    if len(names) == 1:
-        return names[0]
-    return ", ".join(names[:-1]) + f", & {names[-1]}"
+    if len(names) > 1:
+        names[-1] = f"& {names[-1]}"
+    return ", ".join(names)
 
 
 def _parse_date(value: str | None) -> date:
@@ -196,6 +205,11 @@ def _parse_date(value: str | None) -> date:
     return date.fromisoformat(value)
 
 
+@lru_cache(maxsize=1)
+def _load_session_allocations_cached(version: int) -> list[SessionAllocation]:
+    return _load_session_allocations()
+
+
 def _load_session_allocations() -> list[SessionAllocation]:
     allocations: list[SessionAllocation] = []
     for entry in iter_collection("session_allocations"):
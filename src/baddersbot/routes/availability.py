@@ -1,30 +1,31 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from datetime import date
-from pathlib import Path
+from functools import lru_cache
 from typing import Iterable
 
 from fastapi import APIRouter, Form, Request
-from fastapi.responses import HTMLResponse, JSONResponse
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import HTMLResponse, ORJSONResponse
 
+from ..services.db import players_version
 from ..services.repository import (
     get_player,
-    get_player_availability,
+    get_player_availability_iso,
+    iter_players,
     list_availability_snapshots,
-    list_players,
     set_player_availability,
 )
+from ..templating import templates
 from .navigation import build_nav_context
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
-_templates_dir = Path(__file__).resolve().parent.parent / "templates"
-templates = Jinja2Templates(directory=str(_templates_dir))
+_DATE_SEPARATOR = re.compile(r"\s*,\s*")
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerOption:
     id: str
     name: str
@@ -36,7 +37,7 @@ class PlayerOption:
 
 
 @router.get("/availability", response_class=HTMLResponse)
-async def availability_planner(request: Request) -> HTMLResponse:
+def availability_planner(request: Request) -> HTMLResponse:
     players = _load_player_options()
     context = {
         "request": request,
@@ -49,24 +50,24 @@ async def availability_planner(request: Request) -> HTMLResponse:
 
 
 @router.post("/availability", response_class=HTMLResponse)
-async def submit_availability(
+def submit_availability(
     request: Request,
     player_id: str = Form(...),
     available_dates: str = Form(default=""),
 ) -> HTMLResponse:
-    player_records = {option.id: option for option in _load_player_options()}
-    player = player_records.get(player_id)
+    players = _load_player_options()
+    player = {option.id: option for option in players}.get(player_id)
     if not player:
-        return await availability_planner(request)
+        return availability_planner(request)
 
     dates = _parse_dates(available_dates)
     set_player_availability(player.id, dates)
 
-    saved_dates = get_player_availability(player.id)
+    saved_dates = get_player_availability_iso(player.id)
 
     context = {
         "request": request,
-        "players": list(player_records.values()),
+        "players": players,
         "submissions": list_availability_snapshots(),
         "flash": {
             "message": f"Saved availability for {player.name} ({len(saved_dates)} dates).",
@@ -74,25 +75,29 @@ async def submit_availability(
         },
         "recent_selection": {
             "player_id": player.id,
-            "dates": [day.isoformat() for day in saved_dates],
+            "dates": saved_dates,
         },
     }
     context.update(build_nav_context("availability"))
     return templates.TemplateResponse("availability_planner.html", context)
 
 
-@router.get("/availability/{player_id}/slots", response_class=JSONResponse)
-async def availability_slots(player_id: str) -> JSONResponse:
+@router.get("/availability/{player_id}/slots", response_class=ORJSONResponse)
+def availability_slots(player_id: str) -> ORJSONResponse:
     player = get_player(player_id)
     if player is None:
-        return JSONResponse({"player_id": player_id, "dates": []}, status_code=404)
-    dates = get_player_availability(player_id)
-    return JSONResponse({"player_id": player_id, "dates": [day.isoformat() for day in dates]})
+        return ORJSONResponse({"player_id": player_id, "dates": []}, status_code=404)
+    return ORJSONResponse({"player_id": player_id, "dates": get_player_availability_iso(player_id)})
 
 
 def _load_player_options() -> list[PlayerOption]:
+    return _load_player_options_cached(players_version())
+
+
+@lru_cache(maxsize=1)
+def _load_player_options_cached(version: int) -> list[PlayerOption]:
     options: list[PlayerOption] = []
-    for record in list_players():
+    for record in iter_players():
         options.append(
             PlayerOption(
                 id=record.id,
@@ -105,7 +110,9 @@ def _load_player_options() -> list[PlayerOption]:
 
 def _parse_dates(raw: str) -> list[date]:
     dates: list[date] = []
-    for value in [item.strip() for item in raw.split(",") if item.strip()]:
+    for value in _DATE_SEPARATOR.split(raw.strip()):
+        if not value:
+            continue
         try:
             dates.append(date.fromisoformat(value))
         except ValueError:
@@ -1,24 +1,21 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, timedelta
-from pathlib import Path
+from functools import lru_cache
 from typing import Iterable
 
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 
-from ..services.data_store import get_document, iter_collection
+from ..services.data_store import get_data_version, get_document, iter_collection
+from ..templating import render_cached
 from .navigation import build_nav_context
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
-_templates_dir = Path(__file__).resolve().parent.parent / "templates"
-templates = Jinja2Templates(directory=str(_templates_dir))
 
-
-@dataclass
+@dataclass(slots=True)
 class PlayerSummary:
     name: str
     grade: str
@@ -27,7 +24,7 @@ class PlayerSummary:
     notes: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionSummary:
     date: date
     label: str
@@ -35,16 +32,12 @@ class SessionSummary:
     venue: str
     capacity: int
     allocated: int
+    remaining_slots: int = field(init=False)
+    fill_percentage: int = field(init=False)
 
-    @property
-    def remaining_slots(self) -> int:
-        return max(self.capacity - self.allocated, 0)
-
-    @property
-    def fill_percentage(self) -> int:
-        if not self.capacity:
-            return 0
-        return int((self.allocated / self.capacity) * 100)
+    def __post_init__(self) -> None:
+        self.remaining_slots = max(self.capacity - self.allocated, 0)
+        self.fill_percentage = int((self.allocated / self.capacity) * 100) if self.capacity else 0
 
 
 @dataclass
@@ -68,18 +61,52 @@ class WeeklyBlock:
 
 
 WEEKDAY_ORDER = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+_WEEKDAY_INDEX: dict[str, int] = {weekday: index for index, weekday in enumerate(WEEKDAY_ORDER)}
+
+_SECTION_COLOR_MAP: dict[str, dict[str, str]] = {
+    "A Section": {"bg": "#dcb6ff", "fg": "#43186b"},
+    "B1 Section": {"bg": "#ffe08a", "fg": "#5b4300"},
+    "B2 Section": {"bg": "#cde5ff", "fg": "#123d73"},
+    "B3 Section": {"bg": "#bde8c3", "fg": "#0e5133"},
+    "B Sections": {"bg": "#8ad0a4", "fg": "#053822"},
+    "Coaching": {"bg": "#a7d4ff", "fg": "#0b3c63"},
+    "Singles": {"bg": "#ffcc80", "fg": "#6b3a00"},
+    "Match Practice": {"bg": "#ffd4e6", "fg": "#742144"},
+}
+
+_SECTION_ANCHOR_MAP: dict[str, str] = {
+    "A Section": "grade-a",
+    "Coaching": "grade-a",
+    "B Sections": "grade-b",
+    "B1 Section": "grade-b",
+    "B2 Section": "grade-b",
+    "B3 Section": "grade-b",
+    "Singles": "grade-b",
+    "Match Practice": "grade-b",
+}
 
 
 @router.get("/dashboard", response_class=HTMLResponse)
-async def admin_dashboard(request: Request) -> HTMLResponse:
+def admin_dashboard(request: Request) -> HTMLResponse:
     """Render the administrator dashboard with placeholder information."""
-    context = build_dashboard_context()
-    context.update({"request": request})
-    context.update(build_nav_context("dashboard"))
-    return templates.TemplateResponse("admin_dashboard.html", context)
+
+    def build_context() -> dict[str, object]:
+        context = build_dashboard_context()
+        context.update({"request": request})
+        context.update(build_nav_context("dashboard"))
+        return context
+
+    version = (date.today().toordinal(), get_data_version())
+    return render_cached("admin_dashboard.html", version, build_context)
 
 
 def build_dashboard_context() -> dict[str, object]:
+    # The cached context depends on today's date (upcoming window) and the fixture data.
+    return dict(_build_dashboard_context_cached(date.today().toordinal(), get_data_version()))
+
+
+@lru_cache(maxsize=4)
+def _build_dashboard_context_cached(day_ordinal: int, version: int) -> dict[str, object]:
     players = _load_player_summaries()
     sessions = _load_session_summaries()
     alerts = _build_alerts(players, sessions)
@@ -134,17 +161,7 @@ def _format_week_window(window_days: int = 7) -> str:
 
 
 def _section_color_map() -> dict[str, dict[str, str]]:
-    palette = {
-        "A Section": {"bg": "#dcb6ff", "fg": "#43186b"},
-        "B1 Section": {"bg": "#ffe08a", "fg": "#5b4300"},
-        "B2 Section": {"bg": "#cde5ff", "fg": "#123d73"},
-        "B3 Section": {"bg": "#bde8c3", "fg": "#0e5133"},
-        "B Sections": {"bg": "#8ad0a4", "fg": "#053822"},
-        "Coaching": {"bg": "#a7d4ff", "fg": "#0b3c63"},
-        "Singles": {"bg": "#ffcc80", "fg": "#6b3a00"},
-        "Match Practice": {"bg": "#ffd4e6", "fg": "#742144"},
-    }
-    return palette
+    return _SECTION_COLOR_MAP
 
 
 def _load_weekly_schedule() -> dict[str, object]:
@@ -170,7 +187,7 @@ def _load_weekly_schedule() -> dict[str, object]:
             entries[venue_key] = entry_list
         blocks.append(WeeklyBlock(weekday=weekday, time_label=time_label, entries=entries))
 
-    blocks.sort(key=lambda block: (WEEKDAY_ORDER.index(block.weekday), block.time_label))
+    blocks.sort(key=lambda block: (_WEEKDAY_INDEX.get(block.weekday, len(WEEKDAY_ORDER)), block.time_label))
     _assign_allocation_anchors(blocks)
     return {"venues": venues, "blocks": blocks}
 
@@ -183,17 +200,7 @@ def _assign_allocation_anchors(blocks: Iterable[WeeklyBlock]) -> None:
 
 
 def _section_anchor(section: str) -> str | None:
-    mapping = {
-        "A Section": "grade-a",
-        "Coaching": "grade-a",
-        "B Sections": "grade-b",
-        "B1 Section": "grade-b",
-        "B2 Section": "grade-b",
-        "B3 Section": "grade-b",
-        "Singles": "grade-b",
-        "Match Practice": "grade-b",
-    }
-    return mapping.get(section)
+    return _SECTION_ANCHOR_MAP.get(section)
 
 
 def _group_blocks_by_weekday(blocks: Iterable[WeeklyBlock]) -> list[dict[str, object]]:
@@ -22,6 +22,13 @@ _NAV_LINKS: tuple[NavLink, ...] = (
 
 def build_nav_context(active_key: str) -> dict[str, object]:
     """Return template context entries for the global admin navigation bar."""
+    context = _NAV_CONTEXTS.get(active_key)
+    if context is None:
+        context = _build_nav_context(active_key)
+    return context
+
+
+def _build_nav_context(active_key: str) -> dict[str, object]:
     return {
         "nav_links": tuple(_adapt_links(_NAV_LINKS, active_key)),
     }
@@ -35,3 +42,6 @@ def _adapt_links(links: Iterable[NavLink], active_key: str) -> Iterable[dict[str
             "href": link.href,
             "is_active": link.key == active_key,
         }
+
+
+_NAV_CONTEXTS: dict[str, dict[str, object]] = {link.key: _build_nav_context(link.key) for link in _NAV_LINKS}
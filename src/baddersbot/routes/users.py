@@ -1,56 +1,59 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from pathlib import Path
+from dataclasses import dataclass, field
 from typing import Iterable
 
 from fastapi import APIRouter, Query, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 
 from .navigation import build_nav_context
-from ..services.data_store import iter_collection
+from ..services.data_store import get_data_version, iter_collection
+from ..templating import render_cached, templates
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
-_templates_dir = Path(__file__).resolve().parent.parent / "templates"
-templates = Jinja2Templates(directory=str(_templates_dir))
 
-
-@dataclass
+@dataclass(slots=True)
 class PlayerRecord:
     id: str
     name: str
     grade: str
     availability_note: str
     payment_status: str
+    _haystack: str = field(init=False, repr=False, compare=False)
 
-    def matches_query(self, query: str) -> bool:
-        haystack = " ".join([self.name, self.grade, self.payment_status, self.availability_note]).lower()
-        return query.lower() in haystack
+    def __post_init__(self) -> None:
+        self._haystack = f"{self.name} {self.grade} {self.payment_status} {self.availability_note}".lower()
 
 
 @router.get("/users", response_class=HTMLResponse)
-async def manage_users(request: Request, q: str | None = Query(default=None, alias="search")) -> HTMLResponse:
+def manage_users(request: Request, q: str | None = Query(default=None, alias="search")) -> HTMLResponse:
+    if q:
+        return templates.TemplateResponse("user_management.html", _build_users_context(request, q))
+    # Only the unfiltered directory is cached so arbitrary search strings cannot grow the cache.
+    return render_cached("user_management.html", get_data_version(), lambda: _build_users_context(request, None))
+
+
+def _build_users_context(request: Request, query: str | None) -> dict[str, object]:
     records = _load_players()
-    filtered = _filter_records(records, q)
+    filtered = _filter_records(records, query)
 
-    context = {
+    context: dict[str, object] = {
         "request": request,
         "records": filtered,
         "total_count": len(records),
         "visible_count": len(filtered),
-        "search_query": q or "",
+        "search_query": query or "",
     }
     context.update(build_nav_context("users"))
-    return templates.TemplateResponse("user_management.html", context)
+    return context
 
 
 def _filter_records(records: Iterable[PlayerRecord], query: str | None) -> list[PlayerRecord]:
-    records = list(records)
     if not query:
-        return records
-    return [record for record in records if record.matches_query(query)]
+        return list(records)
+    query_lower = query.lower()
+    return [record for record in records if query_lower in record._haystack]
 
 
 def _load_players() -> list[PlayerRecord]:
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import json
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterator
+
+import orjson
 
 _FIXTURE_FILE = Path(__file__).resolve().parent.parent / "data" / "fixtures" / "mock_data.json"
 
@@ -14,14 +15,33 @@ class JsonDataStore:
     def __init__(self, fixture_path: Path) -> None:
         self._fixture_path = fixture_path
         self._cache: dict[str, Any] | None = None
+        self._collections: dict[str, list[dict[str, Any]]] = {}
+        self._version = 0
+
+    def version(self) -> int:
+        """Return the fixture's mtime in nanoseconds, dropping cached data when it changes."""
+        mtime_ns = self._fixture_path.stat().st_mtime_ns
+        if mtime_ns != self._version:
+            self._cache = None
+            self._collections.clear()
+            self._version = mtime_ns
+        return mtime_ns
 
     def _load(self) -> dict[str, Any]:
+        version = self.version()
         if self._cache is None:
-            with self._fixture_path.open("r", encoding="utf-8") as handle:
-                self._cache = json.load(handle)
+            self._cache = _load_json(self._fixture_path.resolve(), version)
         return self._cache
 
     def collection(self, key: str) -> list[dict[str, Any]]:
+        self.version()
+        items = self._collections.get(key)
+        if items is None:
+            items = self._validated_collection(key)
+            self._collections[key] = items
+        return items
+
+    def _validated_collection(self, key: str) -> list[dict[str, Any]]:
         payload = self._load()
         items = payload.get(key)
         if items is None:
@@ -38,14 +58,24 @@ class JsonDataStore:
         return item
 
 
+@lru_cache(maxsize=32)
+def _load_json(path: Path, mtime_ns: int) -> dict[str, Any]:
+    """Parse each revision of a fixture file once, shared by every store reading the same path."""
+    return orjson.loads(path.read_bytes())
+
+
 @lru_cache(maxsize=1)
 def get_data_store() -> JsonDataStore:
     return JsonDataStore(_FIXTURE_FILE)
 
 
-def iter_collection(key: str) -> Iterable[dict[str, Any]]:
-    yield from get_data_store().collection(key)
+def iter_collection(key: str) -> Iterator[dict[str, Any]]:
+    return iter(get_data_store().collection(key))
 
 
 def get_document(key: str) -> dict[str, Any]:
     return get_data_store().document(key)
+
+
+def get_data_version() -> int:
+    return get_data_store().version()
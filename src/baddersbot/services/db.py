@@ -1,15 +1,56 @@
 from __future__ import annotations
 
+import threading
+from itertools import groupby, islice
 from pathlib import Path
-from typing import Iterable
-
-from sqlmodel import Field, Session, SQLModel, create_engine, select
+from typing import Any, Iterable
+
+from sqlalchemy import Index, event, func, inspect
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import (
+    Field,
+    Session,
+    SQLModel,
+    col,
+    create_engine,
+    delete,
+    insert,
+    select,
+)
 
 from .data_store import iter_collection
 
 _DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 _DB_PATH = _DATA_DIR / "baddersbot.db"
-_ENGINE = create_engine(f"sqlite:///{_DB_PATH}", connect_args={"check_same_thread": False})
+_ENGINE = create_engine(
+    f"sqlite:///{_DB_PATH}",
+    connect_args={"check_same_thread": False},
+    insertmanyvalues_page_size=1000,
+)
+SessionLocal = sessionmaker(bind=_ENGINE, class_=Session, expire_on_commit=False)
+
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+_players_version = 0
+_players_version_lock = threading.Lock()
+_PLAYER_UPDATE_COLUMNS = ("name", "grade", "availability_note", "payment_status")
+_SEED_BATCH_SIZE = 1000
+
+
+@event.listens_for(_ENGINE, "connect")
+def _apply_sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
 
 
 class PlayerModel(SQLModel, table=True):
@@ -24,20 +65,57 @@ class PlayerModel(SQLModel, table=True):
 
 class AvailabilityModel(SQLModel, table=True):
     __tablename__ = "availabilities"
+    __table_args__ = (Index("ix_avail_player_date", "player_id", "available_date", unique=True),)
 
     id: int | None = Field(default=None, primary_key=True)
     player_id: str = Field(foreign_key="players.id")
     available_date: str
 
 
+# SQLite checks NOT NULL on the proposed row before resolving ON CONFLICT, so only records
+# carrying every required column can go through the bulk upsert.
+_PLAYER_REQUIRED_COLUMNS = frozenset(
+    column.name for column in SQLModel.metadata.tables["players"].columns if not column.nullable
+)
+
+
 def init_db() -> None:
     _DATA_DIR.mkdir(parents=True, exist_ok=True)
     SQLModel.metadata.create_all(_ENGINE)
+    _ensure_availability_index()
     _seed_players_if_needed()
 
 
+def _ensure_availability_index() -> None:
+    """Backfill the unique availability index on databases created before it existed."""
+    with _ENGINE.begin() as connection:
+        table = SQLModel.metadata.tables["availabilities"]
+        existing = {index["name"] for index in inspect(connection).get_indexes(table.name)}
+        missing = [index for index in table.indexes if index.name not in existing]
+        if not missing:
+            return
+        # Older builds could store the same date twice; keep the earliest row of each pair.
+        earliest_ids = select(func.min(col(AvailabilityModel.id))).group_by(
+            col(AvailabilityModel.player_id), col(AvailabilityModel.available_date)
+        )
+        connection.execute(delete(AvailabilityModel).where(col(AvailabilityModel.id).not_in(earliest_ids)))
+        for index in missing:
+            index.create(connection)
+
+
 def get_session() -> Session:
-    return Session(_ENGINE)
+    return SessionLocal()
+
+
+def players_version() -> int:
+    """Return a counter that increases whenever player rows are written."""
+    return _players_version
+
+
+def _bump_players_version() -> None:
+    global _players_version
+    with _players_version_lock:
+        _players_version += 1
 
 
 def _seed_players_if_needed() -> None:
@@ -46,33 +124,61 @@ def _seed_players_if_needed() -> None:
         if existing:
             return
 
-        players = list(iter_collection("player_directory"))
-        if not players:
+        players = iter_collection("player_directory")
+        inserted = False
+        while chunk := list(islice(players, _SEED_BATCH_SIZE)):
+            rows = [
+                {
+                    "id": str(player.get("id", "")),
+                    "name": str(player.get("name", "")),
+                    "grade": str(player.get("grade", "")),
+                    "availability_note": str(player.get("availability_note", "")),
+                    "payment_status": str(player.get("payment_status", "")),
+                }
+                for player in chunk
+            ]
+            session.execute(insert(PlayerModel), rows)
+            inserted = True
+        if not inserted:
             return
-
-        models = [
-            PlayerModel(
-                id=str(player.get("id", "")),
-                name=str(player.get("name", "")),
-                grade=str(player.get("grade", "")),
-                availability_note=str(player.get("availability_note", "")),
-                payment_status=str(player.get("payment_status", "")),
-            )
-            for player in players
-        ]
-        session.add_all(models)
         session.commit()
+    _bump_players_version()
+
 
+def upsert_players(records: Iterable[dict[str, str]], batch_size: int = 1000) -> None:
+    """Utility helper for future sync tasks.
 
-def upsert_players(records: Iterable[dict[str, str]]) -> None:
-    """Utility helper for future sync tasks."""
+    Records may carry any subset of player columns; only the keys present are written.
+    """
+    iterator = iter(records)
     with get_session() as session:
-        for record in records:
-            player = session.get(PlayerModel, record["id"])
-            if player is None:
-                player = PlayerModel(**record)
-                session.add(player)
-            else:
-                for key, value in record.items():
-                    setattr(player, key, value)
+        while batch := list(islice(iterator, batch_size)):
+            # Consecutive runs keep the caller's ordering when the same id appears twice.
+            for keys, run in groupby(batch, key=frozenset):
+                if _PLAYER_REQUIRED_COLUMNS <= keys:
+                    _bulk_upsert_players(session, keys, list(run))
+                else:
+                    _update_players_individually(session, run)
         session.commit()
+    _bump_players_version()
+
+
+def _bulk_upsert_players(session: Session, keys: frozenset[str], records: list[dict[str, str]]) -> None:
+    statement = sqlite_insert(PlayerModel)
+    statement = statement.on_conflict_do_update(
+        index_elements=[PlayerModel.id],
+        set_={column: statement.excluded[column] for column in _PLAYER_UPDATE_COLUMNS if column in keys},
+    )
+    session.execute(statement, records)
+
+
+def _update_players_individually(session: Session, records: Iterable[dict[str, str]]) -> None:
+    for record in records:
+        # populate_existing picks up rows rewritten by an earlier bulk upsert in this session.
+        player = session.get(PlayerModel, record["id"], populate_existing=True)
+        if player is None:
+            session.add(PlayerModel(**record))
+        else:
+            for key, value in record.items():
+                setattr(player, key, value)
+    session.flush()
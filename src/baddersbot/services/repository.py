@@ -1,15 +1,56 @@
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
 from datetime import date
-from typing import Iterable
-
-from sqlmodel import delete, select
-
-from .db import AvailabilityModel, PlayerModel, get_session
-
-
-@dataclass
+from itertools import groupby
+from typing import Any, Iterable, Iterator, Sequence
+
+from sqlalchemy import bindparam
+from sqlalchemy import select as sa_select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlmodel import col, delete, select
+
+from .db import AvailabilityModel, PlayerModel, get_session, players_version
+
+# Statements are built once at import; SQLAlchemy then reuses their compiled form on every call.
+_PLAYER_COLUMNS = (
+    col(PlayerModel.id),
+    col(PlayerModel.name),
+    col(PlayerModel.grade),
+    col(PlayerModel.availability_note),
+    col(PlayerModel.payment_status),
+)
+# SQLModel's select() is only typed up to four entities, so the five-column list uses SQLAlchemy's.
+_LIST_PLAYERS_STMT = sa_select(*_PLAYER_COLUMNS).order_by(PlayerModel.name)
+_PLAYER_AVAILABILITY_STMT = (
+    select(AvailabilityModel.available_date)
+    .where(AvailabilityModel.player_id == bindparam("player_id"))
+    .distinct()
+    .order_by(AvailabilityModel.available_date)
+)
+_AVAILABILITY_SNAPSHOTS_STMT = (
+    select(PlayerModel.id, PlayerModel.name, AvailabilityModel.available_date)
+    .join(AvailabilityModel, col(AvailabilityModel.player_id) == col(PlayerModel.id))
+    .distinct()
+    .order_by(PlayerModel.name, PlayerModel.id, AvailabilityModel.available_date)
+)
+_DELETE_ALL_AVAILABILITY_STMT = delete(AvailabilityModel).where(
+    col(AvailabilityModel.player_id) == bindparam("player_id")
+)
+_DELETE_UNWANTED_AVAILABILITY_STMT = _DELETE_ALL_AVAILABILITY_STMT.where(
+    col(AvailabilityModel.available_date).not_in(bindparam("wanted", expanding=True))
+)
+_INSERT_AVAILABILITY_STMT = sqlite_insert(AvailabilityModel).on_conflict_do_nothing(
+    index_elements=["player_id", "available_date"]
+)
+
+_PLAYER_STREAM_BATCH = 500
+_players_cache: tuple[int, list[PlayerRecord], dict[str, PlayerRecord]] | None = None
+_players_cache_lock = threading.Lock()
+
+
+@dataclass(slots=True, frozen=True)
 class PlayerRecord:
     id: str
     name: str
@@ -17,76 +58,95 @@ class PlayerRecord:
     availability_note: str | None
     payment_status: str | None
 
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> PlayerRecord:
+        """Build a record from a row selected in ``_PLAYER_COLUMNS`` order."""
+        player_id, name, grade, availability_note, payment_status = row
+        return cls(player_id, name, grade, availability_note, payment_status)
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AvailabilitySnapshot:
     player_id: str
     player_name: str
-    dates: list[date]
+    dates: tuple[date, ...]
 
 
-def list_players() -> list[PlayerRecord]:
+def iter_players() -> Iterator[PlayerRecord]:
+    """Stream players ordered by name without loading every row up front."""
     with get_session() as session:
-        players = session.exec(select(PlayerModel).order_by(PlayerModel.name)).all()
-        return [
-            PlayerRecord(
-                id=player.id,
-                name=player.name,
-                grade=player.grade,
-                availability_note=player.availability_note,
-                payment_status=player.payment_status,
-            )
-            for player in players
-        ]
+        for row in session.execute(_LIST_PLAYERS_STMT.execution_options(yield_per=_PLAYER_STREAM_BATCH)):
+            yield PlayerRecord.from_row(row)
+
+
+def list_players() -> list[PlayerRecord]:
+    records, _ = _cached_players()
+    return list(records)
 
 
 def get_player(player_id: str) -> PlayerRecord | None:
-    with get_session() as session:
-        player = session.get(PlayerModel, player_id)
-        if player is None:
-            return None
-        return PlayerRecord(
-            id=player.id,
-            name=player.name,
-            grade=player.grade,
-            availability_note=player.availability_note,
-            payment_status=player.payment_status,
-        )
+    _, by_id = _cached_players()
+    return by_id.get(player_id)
+
+
+def _cached_players() -> tuple[list[PlayerRecord], dict[str, PlayerRecord]]:
+    """Return players and an id lookup, reloading only after a player write bumps the version."""
+    global _players_cache
+    # Read the version before querying so a concurrent write forces a reload on the next call.
+    version = players_version()
+    cache = _players_cache
+    if cache is not None and cache[0] == version:
+        return cache[1], cache[2]
+    # Hold the lock across the re-check and reload so concurrent misses query the table once.
+    with _players_cache_lock:
+        cache = _players_cache
+        if cache is None or cache[0] < version:
+            records = list(iter_players())
+            cache = (version, records, {record.id: record for record in records})
+            _players_cache = cache
+    return cache[1], cache[2]
 
 
 def get_player_availability(player_id: str) -> list[date]:
+    return [date.fromisoformat(value) for value in get_player_availability_iso(player_id)]
+
+
+def get_player_availability_iso(player_id: str) -> list[str]:
+    """Return the player's distinct availability dates as sorted ISO strings."""
     with get_session() as session:
-        rows = session.exec(
-            select(AvailabilityModel.available_date).where(AvailabilityModel.player_id == player_id)
-        ).all()
-    return sorted({date.fromisoformat(value) for value in rows})
+        return list(session.exec(_PLAYER_AVAILABILITY_STMT, params={"player_id": player_id}).all())
 
 
 def set_player_availability(player_id: str, dates: Iterable[date]) -> None:
-    iso_dates = sorted({day.isoformat() for day in dates})
+    """Replace the player's availability with ``dates`` in a single write transaction.
+
+    Nothing is read first: rows outside ``wanted`` are deleted and every wanted date is
+    inserted with ``ON CONFLICT DO NOTHING``, so concurrent saves never merge a stale read.
+    """
+    wanted = sorted({day.isoformat() for day in dates})
     with get_session() as session:
-        session.exec(delete(AvailabilityModel).where(AvailabilityModel.player_id == player_id))
-        session.commit()
-        if not iso_dates:
-            return
-        session.add_all(
-            [AvailabilityModel(player_id=player_id, available_date=iso) for iso in iso_dates]
-        )
+        if wanted:
+            session.execute(_DELETE_UNWANTED_AVAILABILITY_STMT, {"player_id": player_id, "wanted": wanted})
+            session.execute(
+                _INSERT_AVAILABILITY_STMT,
+                [{"player_id": player_id, "available_date": iso} for iso in wanted],
+            )
+        else:
+            session.execute(_DELETE_ALL_AVAILABILITY_STMT, {"player_id": player_id})
         session.commit()
 
 
 def list_availability_snapshots() -> list[AvailabilitySnapshot]:
+    with get_session() as session:
+        rows = session.exec(_AVAILABILITY_SNAPSHOTS_STMT).all()
+
     snapshots: list[AvailabilitySnapshot] = []
-    players = list_players()
-    for player in players:
-        dates = get_player_availability(player.id)
-        if not dates:
-            continue
+    for (player_id, player_name), group in groupby(rows, key=lambda row: (row[0], row[1])):
         snapshots.append(
             AvailabilitySnapshot(
-                player_id=player.id,
-                player_name=player.name,
-                dates=dates,
+                player_id=player_id,
+                player_name=player_name,
+                dates=tuple(date.fromisoformat(row[2]) for row in group),
             )
         )
     return snapshots
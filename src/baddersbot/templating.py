@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Callable, Hashable
+
+import jinja2
+from fastapi.responses import HTMLResponse
+from fastapi.templating import Jinja2Templates
+
+_TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
+
+
+def _is_production() -> bool:
+    return os.environ.get("BADDERSBOT_ENV", "development").lower() == "production"
+
+
+def _build_environment() -> jinja2.Environment:
+    production = _is_production()
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(str(_TEMPLATES_DIR)),
+        autoescape=True,
+        # With no directory, Jinja uses a per-user 0700 temp directory and checks its ownership.
+        # Entries are keyed on the source checksum, so edited templates are always recompiled.
+        bytecode_cache=jinja2.FileSystemBytecodeCache(),
+        auto_reload=not production,
+        cache_size=-1 if production else 400,
+    )
+
+
+templates = Jinja2Templates(env=_build_environment())
+
+
+_RENDER_CACHE: dict[str, tuple[Hashable, bytes]] = {}
+
+
+def render_cached(
+    name: str,
+    version: Hashable,
+    build_context: Callable[[], dict[str, object]],
+) -> HTMLResponse:
+    """Render ``name`` once per ``version`` and serve the stored bytes until it changes.
+
+    The cache only applies when templates are not auto-reloaded; in development every
+    request renders so template edits show up straight away.
+    """
+    if templates.env.auto_reload:
+        return templates.TemplateResponse(name, build_context())
+    cached = _RENDER_CACHE.get(name)
+    if cached is not None and cached[0] == version:
+        return HTMLResponse(content=cached[1])
+    response = templates.TemplateResponse(name, build_context())
+    _RENDER_CACHE[name] = (version, bytes(response.body))
+    return response
@@ -0,0 +1,26 @@
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from sqlalchemy.engine import Engine
+from sqlmodel import SQLModel, create_engine
+
+from baddersbot.services import db
+
+
+@pytest.fixture
+def isolated_engine(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Engine]:
+    """Point the repository at an empty SQLite file for the duration of a test."""
+    original_engine = db._ENGINE
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}", connect_args={"check_same_thread": False})
+    SQLModel.metadata.create_all(engine)
+    monkeypatch.setattr(db, "_ENGINE", engine)
+    db.SessionLocal.configure(bind=engine)
+    # Invalidate any player cache populated against the real database.
+    db._bump_players_version()
+    try:
+        yield engine
+    finally:
+        db.SessionLocal.configure(bind=original_engine)
+        db._bump_players_version()
+        engine.dispose()
@@ -0,0 +1,20 @@
+import os
+from pathlib import Path
+
+from baddersbot.services.data_store import JsonDataStore
+
+
+def test_store_reloads_when_fixture_changes(tmp_path: Path) -> None:
+    fixture = tmp_path / "mock_data.json"
+    fixture.write_text('{"players": [{"id": "p1"}]}')
+    store = JsonDataStore(fixture)
+
+    first_version = store.version()
+    assert store.collection("players") == [{"id": "p1"}]
+    assert store.version() == first_version
+
+    fixture.write_text('{"players": [{"id": "p1"}, {"id": "p2"}]}')
+    os.utime(fixture, ns=(first_version + 1_000_000_000, first_version + 1_000_000_000))
+
+    assert store.version() != first_version
+    assert store.collection("players") == [{"id": "p1"}, {"id": "p2"}]
@@ -0,0 +1,70 @@
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+from baddersbot.services.db import _ensure_availability_index, upsert_players
+from baddersbot.services.repository import get_player, list_players
+
+_FULL_RECORD = {
+    "id": "player-001",
+    "name": "Amelia Chan",
+    "grade": "A",
+    "availability_note": "Weekday early",
+    "payment_status": "Paid",
+}
+
+
+def test_upsert_players_inserts_then_updates_full_records(isolated_engine: Engine) -> None:
+    upsert_players([_FULL_RECORD])
+    upsert_players([{**_FULL_RECORD, "grade": "B", "payment_status": "Pending"}])
+
+    player = get_player("player-001")
+    assert player is not None
+    assert (player.name, player.grade, player.payment_status) == ("Amelia Chan", "B", "Pending")
+    assert len(list_players()) == 1
+
+
+def test_upsert_players_applies_partial_record_to_existing_player(isolated_engine: Engine) -> None:
+    upsert_players([_FULL_RECORD])
+    upsert_players([{"id": "player-001", "name": "Amelia C."}])
+
+    player = get_player("player-001")
+    assert player is not None
+    assert (player.name, player.grade, player.payment_status) == ("Amelia C.", "A", "Paid")
+
+
+def test_upsert_players_updates_every_column_in_mixed_key_batch(isolated_engine: Engine) -> None:
+    upsert_players([_FULL_RECORD])
+    upsert_players(
+        [
+            {"id": "player-002", "name": "Noah Patel", "grade": "B"},
+            {**_FULL_RECORD, "payment_status": "Overdue"},
+            {"id": "player-002", "payment_status": "Paid"},
+        ]
+    )
+
+    amelia = get_player("player-001")
+    noah = get_player("player-002")
+    assert amelia is not None and amelia.payment_status == "Overdue"
+    assert noah is not None
+    assert (noah.name, noah.grade, noah.payment_status) == ("Noah Patel", "B", "Paid")
+
+
+def test_ensure_availability_index_removes_duplicates_before_backfill(isolated_engine: Engine) -> None:
+    with isolated_engine.begin() as connection:
+        connection.execute(text("DROP INDEX ix_avail_player_date"))
+        connection.execute(
+            text("INSERT INTO availabilities (player_id, available_date) VALUES (:player_id, :available_date)"),
+            [
+                {"player_id": "player-001", "available_date": "2024-04-01"},
+                {"player_id": "player-001", "available_date": "2024-04-01"},
+                {"player_id": "player-001", "available_date": "2024-04-02"},
+            ],
+        )
+
+    _ensure_availability_index()
+
+    with isolated_engine.connect() as connection:
+        rows = connection.execute(text("SELECT id, available_date FROM availabilities ORDER BY id")).all()
+        index_names = {index["name"] for index in inspect(connection).get_indexes("availabilities")}
+    assert rows == [(1, "2024-04-01"), (3, "2024-04-02")]
+    assert "ix_avail_player_date" in index_names
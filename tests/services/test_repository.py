@@ -0,0 +1,65 @@
+from datetime import date
+
+import pytest
+from sqlalchemy.engine import Engine
+from sqlmodel import select
+
+from baddersbot.services.db import AvailabilityModel, get_session, upsert_players
+from baddersbot.services.repository import (
+    get_player_availability,
+    list_availability_snapshots,
+    set_player_availability,
+)
+
+_PLAYER_ID = "player-001"
+
+
+@pytest.fixture
+def player(isolated_engine: Engine) -> str:
+    upsert_players([{"id": _PLAYER_ID, "name": "Amelia Chan", "grade": "A"}])
+    return _PLAYER_ID
+
+
+def _stored_row_count(player_id: str) -> int:
+    with get_session() as session:
+        rows = session.exec(select(AvailabilityModel).where(AvailabilityModel.player_id == player_id)).all()
+    return len(rows)
+
+
+def test_set_player_availability_applies_add_remove_noop_and_clear(player: str) -> None:
+    set_player_availability(player, [date(2024, 4, 2), date(2024, 4, 1)])
+    assert get_player_availability(player) == [date(2024, 4, 1), date(2024, 4, 2)]
+
+    set_player_availability(player, [date(2024, 4, 2), date(2024, 4, 3)])
+    assert get_player_availability(player) == [date(2024, 4, 2), date(2024, 4, 3)]
+
+    set_player_availability(player, [date(2024, 4, 3), date(2024, 4, 2)])
+    assert get_player_availability(player) == [date(2024, 4, 2), date(2024, 4, 3)]
+    assert _stored_row_count(player) == 2
+
+    set_player_availability(player, [])
+    assert get_player_availability(player) == []
+    assert _stored_row_count(player) == 0
+
+
+def test_set_player_availability_replaces_rows_written_by_a_concurrent_save(player: str) -> None:
+    set_player_availability(player, [date(2024, 4, 1)])
+    # Another save commits one date we want and one we do not, straight to the table.
+    with get_session() as session:
+        session.add(AvailabilityModel(player_id=player, available_date="2024-04-02"))
+        session.add(AvailabilityModel(player_id=player, available_date="2024-04-05"))
+        session.commit()
+
+    set_player_availability(player, [date(2024, 4, 1), date(2024, 4, 2)])
+
+    assert get_player_availability(player) == [date(2024, 4, 1), date(2024, 4, 2)]
+    assert _stored_row_count(player) == 2
+
+
+def test_list_availability_snapshots_returns_hashable_records(player: str) -> None:
+    set_player_availability(player, [date(2024, 4, 2), date(2024, 4, 1)])
+
+    (snapshot,) = list_availability_snapshots()
+
+    assert snapshot.dates == (date(2024, 4, 1), date(2024, 4, 2))
+    assert hash(snapshot) == hash(list_availability_snapshots()[0])
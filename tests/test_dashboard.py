@@ -1,14 +1,18 @@
+from typing import Iterator
+
+import pytest
 from fastapi.testclient import TestClient
 
 from baddersbot.app import create_app
 
 
-def get_client() -> TestClient:
-    return TestClient(create_app())
+@pytest.fixture(scope="module")
+def client() -> Iterator[TestClient]:
+    with TestClient(create_app()) as test_client:
+        yield test_client
 
 
-def test_admin_dashboard_renders() -> None:
-    client = get_client()
+def test_admin_dashboard_renders(client: TestClient) -> None:
     response = client.get("/admin/dashboard")
 
     assert response.status_code == 200
@@ -17,8 +21,7 @@ def test_admin_dashboard_renders() -> None:
     assert "Upcoming Week Sessions" in response.text
 
 
-def test_allocation_management_renders() -> None:
-    client = get_client()
+def test_allocation_management_renders(client: TestClient) -> None:
     response = client.get("/admin/allocation")
 
     assert response.status_code == 200
@@ -26,8 +29,7 @@ def test_allocation_management_renders() -> None:
     assert "Manual Change Log" in response.text
 
 
-def test_allocation_messages_renders() -> None:
-    client = get_client()
+def test_allocation_messages_renders(client: TestClient) -> None:
     response = client.get("/admin/allocation/messages")
 
     assert response.status_code == 200
@@ -35,8 +37,7 @@ def test_allocation_messages_renders() -> None:
     assert "Tue 6pm - Court 1" in response.text
 
 
-def test_manage_users_renders() -> None:
-    client = get_client()
+def test_manage_users_renders(client: TestClient) -> None:
     response = client.get("/admin/users")
 
     assert response.status_code == 200
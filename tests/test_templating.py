@@ -0,0 +1,33 @@
+import pytest
+
+from baddersbot import templating
+
+
+def _unexpected_context() -> dict[str, object]:
+    raise AssertionError("cache hit should not rebuild the context")
+
+
+def test_render_cached_returns_stored_bytes_on_hit(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(templating.templates.env, "auto_reload", False)
+    monkeypatch.setattr(templating, "_RENDER_CACHE", {"page.html": (3, b"<p>stored</p>")})
+
+    response = templating.render_cached("page.html", 3, _unexpected_context)
+
+    assert response.body == b"<p>stored</p>"
+
+
+def test_render_cached_skips_cache_when_auto_reloading(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(templating.templates.env, "auto_reload", True)
+    monkeypatch.setattr(templating, "_RENDER_CACHE", {"page.html": (3, b"<p>stored</p>")})
+    rendered = []
+
+    def fake_template_response(name: str, context: dict[str, object]) -> object:
+        rendered.append(name)
+        return templating.HTMLResponse(content=b"<p>fresh</p>")
+
+    monkeypatch.setattr(templating.templates, "TemplateResponse", fake_template_response)
+
+    response = templating.render_cached("page.html", 3, dict)
+
+    assert response.body == b"<p>fresh</p>"
+    assert rendered == ["page.html"]